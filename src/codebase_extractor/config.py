@@ -1,4 +1,5 @@
 from pathlib import Path
+import re
 import sys
 
 # --- CONFIGURATION ---
@@ -9,7 +10,9 @@ SCRIPT_FILENAME = Path(sys.argv[0]).name
 OUTPUT_DIR_NAME = "CODEBASE_EXTRACTS"
 
 # --- FILE/FOLDER LISTS ---
-EXCLUDED_DIRS = {
+# The four filter sets are interned so the per-file membership probes in
+# the extraction loop can hit CPython's pointer-equality fast path.
+EXCLUDED_DIRS = frozenset(map(sys.intern, {
     # Standard exclusions
     "node_modules", "vendor", "__pycache__", "dist", "build", "target", ".next",
     ".git", ".svn", ".hg", ".vscode", ".idea", "venv", ".venv",
@@ -18,17 +21,17 @@ EXCLUDED_DIRS = {
     ".gradle",     # Internal Gradle cache
     "Pods",        # iOS external dependencies
     "DerivedData", # iOS build artifacts
-}
-EXCLUDED_FILENAMES = {
+}))
+EXCLUDED_FILENAMES = frozenset(map(sys.intern, {
     "package-lock.json", "yarn.lock", "composer.lock", ".env", "Podfile.lock",
-}
-ALLOWED_FILENAMES = {
+}))
+ALLOWED_FILENAMES = frozenset(map(sys.intern, {
 # General
     "dockerfile", ".gitignore", ".htaccess", "makefile", ".dockerignore", ".env.example",
     # Mobile
     "podfile", "gemfile", "jenkinsfile", "gradlew",
-}
-ALLOWED_EXTENSIONS = {
+}))
+ALLOWED_EXTENSIONS = frozenset(map(sys.intern, {
 # Web & General
     ".php", ".html", ".css", ".js", ".jsx", ".ts", ".tsx", ".vue", ".svelte",
     ".py", ".rb", ".java", ".c", ".cpp", ".cs", ".go", ".rs", ".json", ".xml",
@@ -46,7 +49,7 @@ ALLOWED_EXTENSIONS = {
     
     # Scripts
     ".sh", ".bat",
-}
+}))
 
 # --- MAPPINGS & CONSTANTS ---
 EXTENSION_LANG_MAP = {
@@ -67,6 +70,21 @@ EXTENSION_LANG_MAP = {
     ".arb": "json",
     ".bat": "batch",
 }
+# Single-lookup map for the extraction hot loop: every allowed extension maps
+# to its code-fence language ("" when there is no specific highlighting).
+ALLOWED_LANG_MAP = {ext: EXTENSION_LANG_MAP.get(ext, "") for ext in ALLOWED_EXTENSIONS}
+
+# Compiled once: matches any name admissible under the default lists (an
+# always-allowed filename, or an allowed extension at the end of the name).
+# The hot filter uses one C-level scan to reject files before the precise
+# Python-level checks run.
+FILENAME_ADMIT_RE = re.compile(
+    r"^(?:" + "|".join(re.escape(n) for n in sorted(ALLOWED_FILENAMES)) + r")$"
+    r"|\.(?:" + "|".join(re.escape(e[1:]) for e in sorted(ALLOWED_EXTENSIONS)) + r")$",
+    re.IGNORECASE,
+)
+
 MAX_FILE_SIZE_MB = 1
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 FILE_COUNT_WARNING_THRESHOLD = 1000
 LOGO_BREAKPOINT = 144
\ No newline at end of file
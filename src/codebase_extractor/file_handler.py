@@ -1,16 +1,18 @@
 import os
 import datetime
+import shutil
 import uuid
 import logging
 from pathlib import Path
 from termcolor import colored
 from . import config
-from . import __version__  
-import questionary
+from . import __version__
 
 
 def get_folder_choices(root_path: Path, max_depth: int) -> list:
     """Recursively finds folders up to a max depth and prepares them for questionary with a visual tree."""
+    import questionary  # deferred: only the interactive wizard needs it
+
     choices = []
 
     def scanner(current_path: Path, prefix: str, depth: int):
@@ -20,23 +22,26 @@ def get_folder_choices(root_path: Path, max_depth: int) -> list:
             return
             
         try:
-            # Get a sorted list of valid subdirectories
-            subdirs = sorted([
-                p for p in current_path.iterdir()
-                if p.is_dir() and p.name not in config.EXCLUDED_DIRS
-            ])
-            
+            # Get a sorted list of valid subdirectory names; scandir's cached
+            # metadata means excluded dirs are pruned without extra stat calls
+            with os.scandir(current_path) as it:
+                subdirs = sorted(
+                    entry.name for entry in it
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in config.EXCLUDED_DIRS
+                )
+
             # Iterate through the subdirectories to build the tree display
-            for i, subdir in enumerate(subdirs):
+            for i, name in enumerate(subdirs):
+                subdir = current_path / name
                 is_last = (i == len(subdirs) - 1)
-                
+
                 # Use '└─' for the last item and '├─' for others
                 connector = "└─ " if is_last else "├─ "
-                display_name = f"{prefix}{connector}{subdir.name}"
-                
+                display_name = f"{prefix}{connector}{name}"
+
                 relative_path = subdir.relative_to(root_path)
                 choices.append(questionary.Choice(title=display_name, value=relative_path))
-                
+
                 # Prepare the prefix for the next level of recursion
                 # Use a blank prefix for children of the last item, and a pipe for others
                 child_prefix = prefix + ("    " if is_last else "│   ")
@@ -56,6 +61,24 @@ def get_folder_choices(root_path: Path, max_depth: int) -> list:
     return choices
 
 
+def _count_only(_chunk: str) -> None:
+    """Dry-run sink: the emit() wrappers still count chars/words, the
+    chunk itself is dropped instead of being buffered or written."""
+
+
+def _read_file_text(path: Path):
+    """
+    Reads a file as one syscall and decodes it in a single pass.
+
+    Returns None for binary-looking content (NUL byte in the first 8KB) so
+    callers can skip files that slipped through the extension filters.
+    """
+    data = path.read_bytes()
+    if b"\x00" in data[:8192]:
+        return None
+    return data.decode("utf-8", errors="replace")
+
+
 def is_allowed_file(
     path: Path,
     exclude_large: bool,
@@ -63,6 +86,7 @@ def is_allowed_file(
     excluded_filenames: set = None,
     allowed_filenames: set = None,
     allowed_extensions: set = None,
+    entry: os.DirEntry = None,
 ) -> bool:
     """
     Checks if a file should be included based on its name, extension, and size.
@@ -74,6 +98,8 @@ def is_allowed_file(
         excluded_filenames: Set of filenames to exclude (default from config)
         allowed_filenames: Set of filenames to always allow (default from config)
         allowed_extensions: Set of extensions to allow (default from config)
+        entry: Optional os.DirEntry for the same path; its cached metadata is
+            reused for the is_file and size checks to avoid extra stat() calls
 
     Returns:
         True if the file should be included, False otherwise
@@ -87,16 +113,32 @@ def is_allowed_file(
 
     if path.name == config.SCRIPT_FILENAME:
         return False
+    # Fast path for the default lists: one regex scan rejects inadmissible
+    # names before the lower() + set probes below. Any name the regex misses
+    # is neither an allowed filename nor an allowed extension.
+    if (
+        allowed_filenames is config.ALLOWED_FILENAMES
+        and allowed_extensions is config.ALLOWED_EXTENSIONS
+        and not config.FILENAME_ADMIT_RE.search(path.name)
+    ):
+        return False
     if path.name.lower() in allowed_filenames:
         return True
-    if not path.is_file():
+    if not (entry.is_file() if entry is not None else path.is_file()):
         return False
     if path.name.lower() in excluded_filenames:
         return False
     if path.suffix.lower() not in allowed_extensions:
         return False
-    if exclude_large and path.stat().st_size > max_file_size_mb * 1024 * 1024:
-        return False
+    if exclude_large:
+        max_bytes = (
+            config.MAX_FILE_SIZE_BYTES
+            if max_file_size_mb == config.MAX_FILE_SIZE_MB
+            else max_file_size_mb * 1024 * 1024
+        )
+        size = entry.stat().st_size if entry is not None else path.stat().st_size
+        if size > max_bytes:
+            return False
     return True
 
 
@@ -108,6 +150,8 @@ def extract_code_from_folder(
     excluded_filenames: set = None,
     allowed_filenames: set = None,
     allowed_extensions: set = None,
+    out_fh=None,
+    dry_run: bool = False,
 ) -> tuple[str, int, int, int]:
     """
     Extracts code from a given folder, respecting EXCLUDED_DIRS at all depths.
@@ -120,6 +164,11 @@ def extract_code_from_folder(
         excluded_filenames: Set of filenames to exclude (default from config)
         allowed_filenames: Set of filenames to always allow (default from config)
         allowed_extensions: Set of extensions to allow (default from config)
+        out_fh: Optional writable text handle; when given, content is streamed
+            to it as files are read (keeping peak memory at one file) and the
+            returned content string is empty
+        dry_run: When True, files are still read and counted but no markdown
+            is accumulated, so previews cost counts rather than bytes
 
     Returns:
         A tuple containing the content string, file count, char count, and word count.
@@ -127,36 +176,66 @@ def extract_code_from_folder(
     if excluded_dirs is None:
         excluded_dirs = config.EXCLUDED_DIRS
 
-    content = f"# Folder: {folder.relative_to(Path.cwd())}\n\n"
+    chunks = []
+    char_count = 0
+    word_count = 0
+    if dry_run:
+        sink = _count_only
+    elif out_fh is not None:
+        sink = out_fh.write
+    else:
+        sink = chunks.append
+
+    def emit(chunk: str):
+        """Streams or buffers one chunk while tracking the output metrics."""
+        nonlocal char_count, word_count
+        char_count += len(chunk)
+        word_count += len(chunk.split())
+        sink(chunk)
+
+    emit(f"# Folder: {folder.relative_to(Path.cwd())}\n\n")
     extracted_files = 0
+    # Depth-first scandir walk: DirEntry carries cached is_dir/is_file/stat
+    # metadata from readdir, so the filter never needs a second stat() call.
     dirs_to_visit = [folder]
     while dirs_to_visit:
-        current_dir = dirs_to_visit.pop(0)
-        for item in sorted(current_dir.iterdir()):
-            if item.is_dir() and item.name not in excluded_dirs:
-                dirs_to_visit.append(item)
-            elif item.is_file() and is_allowed_file(
+        current_dir = dirs_to_visit.pop()
+        subdirs = []
+        try:
+            with os.scandir(current_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (PermissionError, FileNotFoundError):
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in excluded_dirs and entry.name != config.OUTPUT_DIR_NAME:
+                    subdirs.append(Path(entry.path))
+                continue
+            item = Path(entry.path)
+            if is_allowed_file(
                 item, exclude_large, max_file_size_mb,
-                excluded_filenames, allowed_filenames, allowed_extensions
+                excluded_filenames, allowed_filenames, allowed_extensions,
+                entry=entry,
             ):
                 try:
+                    text = _read_file_text(item)
+                    if text is None:
+                        continue  # binary content that slipped through the filters
                     rel_path = item.relative_to(Path.cwd())
-                    ext = item.suffix
-                    lang = config.EXTENSION_LANG_MAP.get(ext, "")
-                    content += f"## {rel_path}\n\n```{lang}\n"
-                    content += item.read_text(errors="ignore")
-                    content += "\n```\n\n"
+                    ext = item.suffix.lower()
+                    lang = config.ALLOWED_LANG_MAP.get(ext, "")
+                    # One emit per file keeps the write path to a single call
+                    emit(f"## {rel_path}\n\n```{lang}\n{text}\n```\n\n")
                     extracted_files += 1
                 except Exception as e:
                     logging.warning(f"Could not read file {item.name}: {e}")
-                    content += f"\n\n"
+                    emit("\n\n")
+        # Reversed so the stack pops subdirectories in sorted order
+        dirs_to_visit.extend(reversed(subdirs))
     if extracted_files > config.FILE_COUNT_WARNING_THRESHOLD:
         logging.warning(colored(f"> Caution: Large file count in '{folder.name}' ({extracted_files} files).", "yellow"))
 
-    # ADDED: Calculate character and word counts
-    char_count = len(content)
-    word_count = len(content.split())
-
+    content = "" if out_fh is not None else "".join(chunks)
     return content, extracted_files, char_count, word_count
 
 
@@ -167,6 +246,8 @@ def extract_code_from_root(
     excluded_filenames: set = None,
     allowed_filenames: set = None,
     allowed_extensions: set = None,
+    out_fh=None,
+    dry_run: bool = False,
 ) -> tuple[str, int, int, int]:
     """
     Extracts code only from files present in the root directory.
@@ -178,35 +259,65 @@ def extract_code_from_root(
         excluded_filenames: Set of filenames to exclude (default from config)
         allowed_filenames: Set of filenames to always allow (default from config)
         allowed_extensions: Set of extensions to allow (default from config)
+        out_fh: Optional writable text handle; when given, content is streamed
+            to it as files are read and the returned content string is empty
+        dry_run: When True, files are still read and counted but no markdown
+            is accumulated, so previews cost counts rather than bytes
 
     Returns:
         A tuple containing the content string, file count, char count, and word count.
     """
-    content = f"# Root Files: {root_path.name}\n\n"
+    chunks = []
+    char_count = 0
+    word_count = 0
+    if dry_run:
+        sink = _count_only
+    elif out_fh is not None:
+        sink = out_fh.write
+    else:
+        sink = chunks.append
+
+    def emit(chunk: str):
+        """Streams or buffers one chunk while tracking the output metrics."""
+        nonlocal char_count, word_count
+        char_count += len(chunk)
+        word_count += len(chunk.split())
+        sink(chunk)
+
+    emit(f"# Root Files: {root_path.name}\n\n")
     extracted_files = 0
-    for filepath in sorted(root_path.iterdir()):
-        if filepath.is_file() and is_allowed_file(
+    with os.scandir(root_path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        filepath = Path(entry.path)
+        if entry.is_file() and is_allowed_file(
             filepath, exclude_large, max_file_size_mb,
-            excluded_filenames, allowed_filenames, allowed_extensions
+            excluded_filenames, allowed_filenames, allowed_extensions,
+            entry=entry,
         ):
-            ext = filepath.suffix
-            lang = config.EXTENSION_LANG_MAP.get(ext, "")
-            content += f"## {filepath.name}\n\n```{lang}\n"
-            content += filepath.read_text(errors="ignore")
-            content += "\n```\n\n"
+            text = _read_file_text(filepath)
+            if text is None:
+                continue  # binary content that slipped through the filters
+            ext = filepath.suffix.lower()
+            lang = config.ALLOWED_LANG_MAP.get(ext, "")
+            # One emit per file keeps the write path to a single call
+            emit(f"## {filepath.name}\n\n```{lang}\n{text}\n```\n\n")
             extracted_files += 1
     if extracted_files > config.FILE_COUNT_WARNING_THRESHOLD:
         logging.warning(colored(f"> Caution: Large file count in root ({extracted_files} files).", "yellow"))
 
-    # ADDED: Calculate character and word counts
-    char_count = len(content)
-    word_count = len(content.split())
-
+    content = "" if out_fh is not None else "".join(chunks)
     return content, extracted_files, char_count, word_count
 
 
-def write_to_markdown_file(content: str, metadata: dict, root_path: Path, output_dir_name: str):
-    """Constructs a YAML header and writes the full content to a timestamped Markdown file."""
+def write_to_markdown_file(content: str, metadata: dict, root_path: Path, output_dir_name: str, content_file: Path = None):
+    """
+    Constructs a YAML header and writes the full content to a timestamped Markdown file.
+
+    When `content_file` is given it is a temp file holding streamed extraction
+    output; its contents are copied in after the header (without loading the
+    whole file into memory) and the temp file is removed.
+    """
     output_dir = Path(output_dir_name)
     output_dir.mkdir(exist_ok=True)
     
@@ -237,9 +348,15 @@ tool_details:
 ---
 
 """
-    full_content = yaml_header + content
     with open(full_filepath, "w", encoding="utf-8") as f:
-        f.write(full_content)
-    
+        f.write(yaml_header)
+        if content_file is not None:
+            with open(content_file, "r", encoding="utf-8") as src:
+                shutil.copyfileobj(src, f, 1 << 20)
+        else:
+            f.write(content)
+    if content_file is not None:
+        content_file.unlink(missing_ok=True)
+
     logging.info(f"\n💾 Saved to {colored(str(full_filepath), 'cyan')}")
     return str(full_filepath)
\ No newline at end of file
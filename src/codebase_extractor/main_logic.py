@@ -1,40 +1,45 @@
 import os
 import sys
-import time
 import datetime
 import uuid
 import shutil
+import tempfile
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 
-import questionary
-from halo import Halo
 from termcolor import colored
-from prompt_toolkit.styles import Style
-from questionary import Validator, ValidationError
 
 # Import from our modules
+# NOTE: questionary/halo/textual are imported lazily inside the code paths
+# that use them - they dominate cold-start time for non-interactive runs.
 from . import config
 from . import ui
 from . import file_handler
 from . import cli
-from . import tui
 
-class NumberValidator(Validator):
-    """Validates that the input is a positive integer."""
-    def validate(self, document):
-        try:
-            value = int(document.text)
-            if value <= 0:
+
+def _build_number_validator():
+    """Builds the questionary validator lazily so automated runs skip the import."""
+    from questionary import Validator, ValidationError
+
+    class NumberValidator(Validator):
+        """Validates that the input is a positive integer."""
+        def validate(self, document):
+            try:
+                value = int(document.text)
+                if value <= 0:
+                    raise ValidationError(
+                        message="Please enter a positive number.",
+                        cursor_position=len(document.text))
+            except ValueError:
                 raise ValidationError(
-                    message="Please enter a positive number.",
+                    message="Please enter a valid number.",
                     cursor_position=len(document.text))
-        except ValueError:
-            raise ValidationError(
-                message="Please enter a valid number.",
-                cursor_position=len(document.text))
+
+    return NumberValidator
 
 
 def setup_logging(verbose: bool, log_file: Optional[str] = None):
@@ -72,11 +77,17 @@ def main():
         # Priority: 1) Non-interactive mode (--mode)  2) TUI mode (--tui)  3) Default wizard
         is_fully_automated = args.mode is not None
         if not is_fully_automated and args.tui:
+            from . import tui  # deferred: pulls in textual/rich
             tui.launch_tui()
             return
 
+        # rich ships with textual, so this adds no new dependency; one
+        # persistent renderer replaces Halo's per-folder spinner threads
+        from rich.progress import Progress
+
         output_dir_name = args.output_dir if args.output_dir else config.OUTPUT_DIR_NAME
-        config.EXCLUDED_DIRS.add(output_dir_name)
+        # EXCLUDED_DIRS is a frozenset; rebind rather than mutate
+        config.EXCLUDED_DIRS = config.EXCLUDED_DIRS | {output_dir_name}
 
         root_path = args.root.resolve() if args.root else Path.cwd()
         if not root_path.is_dir():
@@ -97,10 +108,12 @@ def main():
             ui.print_banner(show_instructions=False)
         
         # --- Collect Settings (Interactively or from Args) ---
-        select_style = Style([('qmark', 'fg:#FFA500'), ('pointer', 'fg:#FFA500'), ('highlighted', 'fg:black bg:#FFA500'), ('selected', 'fg:black bg:#FFA500')])
-        
         exclude_large = args.exclude_large_files
         if not is_fully_automated:
+            import questionary
+            from prompt_toolkit.styles import Style
+
+            select_style = Style([('qmark', 'fg:#FFA500'), ('pointer', 'fg:#FFA500'), ('highlighted', 'fg:black bg:#FFA500'), ('selected', 'fg:black bg:#FFA500')])
             logging.info("=== Extraction Settings ===")
             exclude_large_choice = questionary.select("[1/2] -- Exclude files larger than 1MB?", choices=["no", "yes"], style=select_style, instruction=" ").ask()
             if exclude_large_choice is None: raise KeyboardInterrupt
@@ -115,16 +128,30 @@ def main():
         folders_to_process = set()
         process_root_files = False
         
-        run_ref = str(uuid.uuid4())
-        run_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        run_ref = uuid.uuid4().hex
+        run_timestamp = datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds")
 
         if selection_mode == "everything":
-            folders_to_process.update([p for p in root_path.iterdir() if p.is_dir() and p.name not in config.EXCLUDED_DIRS])
+            # os.scandir avoids the extra stat() per entry that Path.iterdir incurs
+            with os.scandir(root_path) as entries:
+                candidates = [
+                    root_path / entry.name for entry in entries
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in config.EXCLUDED_DIRS
+                ]
+            # One shallow scandir per candidate drops empty folders before
+            # they cost a progress unit and a full recursive walk
+            for candidate in candidates:
+                try:
+                    with os.scandir(candidate) as it:
+                        if next(it, None) is not None:
+                            folders_to_process.add(candidate)
+                except PermissionError:
+                    continue
             process_root_files = True
         else: # 'specific' mode
             scan_depth = args.depth
             if scan_depth is None and not is_fully_automated:
-                depth_str = questionary.text("-- How many levels deep should we scan for folders?", default="3", validate=NumberValidator, style=select_style).ask()
+                depth_str = questionary.text("-- How many levels deep should we scan for folders?", default="3", validate=_build_number_validator(), style=select_style).ask()
                 if depth_str is None: raise KeyboardInterrupt
                 scan_depth = int(depth_str)
             elif scan_depth is None:
@@ -143,48 +170,101 @@ def main():
                     process_root_files = True; selected_options.remove("ROOT_SENTINEL")
                 selected_paths = [root_path / p for p in selected_options]
             
-            sorted_paths = sorted(selected_paths, key=lambda p: len(p.parts))
-            final_paths = set()
+            # Sorting by parts places every path right after its ancestors, so a
+            # kept ancestor of the current path can only be the last path kept.
+            sorted_paths = sorted(selected_paths, key=lambda p: p.parts)
+            kept = []
             for path in sorted_paths:
-                if not any(path.is_relative_to(parent) for parent in final_paths): final_paths.add(path)
-            folders_to_process.update(final_paths)
+                if kept and path.parts[:len(kept[-1].parts)] == kept[-1].parts:
+                    continue
+                kept.append(path)
+            folders_to_process.update(kept)
 
         if not is_fully_automated: print()
         total_files_extracted = 0
 
         # --- Processing ---
-        for folder_path in sorted(list(folders_to_process)):
-            with Halo(text=f"Extracting {folder_path.relative_to(root_path)}...", spinner="dots"):
-                time.sleep(0.1)
-                # CHANGED: Unpack the new char_count and word_count values
-                folder_md, folder_count, char_count, word_count = file_handler.extract_code_from_folder(folder_path, exclude_large)
-            
+        # Extraction is I/O-bound, so folders are extracted concurrently; the
+        # results are then reported/written in sorted order for determinism.
+        # Unless this is a dry run, content is streamed to a temp file per
+        # folder so peak memory stays at one source file, not a whole folder.
+        # parts is memoized on the Path, so comparisons stay plain tuple
+        # compares instead of Path.__lt__'s case-folded string property
+        sorted_folders = sorted(folders_to_process, key=lambda p: p.parts)
+        output_dir = Path(output_dir_name)
+        output_dir_path = output_dir.resolve()
+        if not args.dry_run and (sorted_folders or process_root_files):
+            output_dir.mkdir(exist_ok=True)
+
+        def extract_folder(folder_path):
+            """Extracts one folder, streaming its content to a temp file unless dry-run."""
+            if args.dry_run:
+                # dry_run=True keeps the counts but skips buffering the markdown
+                return file_handler.extract_code_from_folder(folder_path, exclude_large, dry_run=True), None
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", suffix=".part", dir=output_dir, delete=False, buffering=1 << 20
+            ) as out_fh:
+                result = file_handler.extract_code_from_folder(folder_path, exclude_large, out_fh=out_fh)
+            return result, Path(out_fh.name)
+
+        results = {}
+        if sorted_folders:
+            max_workers = min(8, (os.cpu_count() or 1) * 2)
+            with Progress(transient=True) as progress:
+                task = progress.add_task("Extracting folders", total=len(sorted_folders))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(extract_folder, folder_path): folder_path
+                        for folder_path in sorted_folders
+                    }
+                    for future in as_completed(futures):
+                        folder_path = futures[future]
+                        results[folder_path] = future.result()
+                        progress.update(task, description=f"Extracting {folder_path.relative_to(root_path)}")
+                        progress.advance(task)
+
+        for folder_path in sorted_folders:
+            rel = folder_path.relative_to(root_path)
+            # CHANGED: Unpack the new char_count and word_count values
+            (folder_md, folder_count, char_count, word_count), content_file = results[folder_path]
+
             if folder_count > 0:
                 # CHANGED: Add new metrics to the metadata dictionary
                 metadata = {
                     "run_ref": run_ref, 
                     "run_timestamp": run_timestamp, 
-                    "folder_name": str(folder_path.relative_to(root_path)), 
+                    "folder_name": str(rel),
                     "file_count": folder_count,
                     "char_count": char_count,
                     "word_count": word_count
                 }
                 if not args.dry_run:
-                    file_handler.write_to_markdown_file(folder_md, metadata, root_path, output_dir_name)
-                logging.info(f"✅ Extracted {folder_count} file(s) from: {folder_path.relative_to(root_path)}")
+                    file_handler.write_to_markdown_file(folder_md, metadata, root_path, output_dir_name, content_file=content_file)
+                logging.info(f"✅ Extracted {folder_count} file(s) from: {rel}")
                 logging.info(f"📜 {char_count:,} character(s), {word_count:,} word(s)")
                 if args.dry_run: logging.info(colored(" (Dry Run: No file written)", "yellow"))
                 total_files_extracted += folder_count
             else:
-                logging.warning(f"‼️ No extractable files in: {folder_path.relative_to(root_path)}")
+                if content_file is not None:
+                    content_file.unlink(missing_ok=True)
+                logging.warning(f"‼️ No extractable files in: {rel}")
             logging.info("")
 
         if process_root_files:
             root_display_name = f"root [{root_path.name}] (files in root folder only, excl. sub-folders)"
-            with Halo(text=f"Extracting {root_display_name}...", spinner="dots"):
-                time.sleep(0.1)
+            with Progress(transient=True) as progress:
+                task = progress.add_task(f"Extracting {root_display_name}...", total=1)
+                root_content_file = None
                 # CHANGED: Unpack the new char_count and word_count values
-                root_md, root_count, char_count, word_count = file_handler.extract_code_from_root(root_path, exclude_large)
+                if args.dry_run:
+                    root_md, root_count, char_count, word_count = file_handler.extract_code_from_root(root_path, exclude_large, dry_run=True)
+                else:
+                    with tempfile.NamedTemporaryFile(
+                        "w", encoding="utf-8", suffix=".part", dir=output_dir, delete=False, buffering=1 << 20
+                    ) as out_fh:
+                        root_content_file = Path(out_fh.name)
+                        root_md, root_count, char_count, word_count = file_handler.extract_code_from_root(root_path, exclude_large, out_fh=out_fh)
+                progress.advance(task)
             
             if root_count > 0:
                 # CHANGED: Add new metrics to the metadata dictionary
@@ -197,18 +277,19 @@ def main():
                     "word_count": word_count
                 }
                 if not args.dry_run:
-                    file_handler.write_to_markdown_file(root_md, metadata, root_path, output_dir_name)
+                    file_handler.write_to_markdown_file(root_md, metadata, root_path, output_dir_name, content_file=root_content_file)
                 total_files_extracted += root_count
                 logging.info(f"✅ Extracted {root_count} file(s) from the root directory")
                 logging.info(f"📜 {char_count:,} character(s), {word_count:,} word(s)")
                 if args.dry_run: logging.info(colored(" (Dry Run: No file written)", "yellow"))
             else:
+                if root_content_file is not None:
+                    root_content_file.unlink(missing_ok=True)
                 logging.warning("‼️ No extractable files in the root directory")
             logging.info("")
         
         # --- Final Summary ---
         if total_files_extracted > 0:
-            output_dir_path = Path(output_dir_name).resolve()
             logging.info(colored(f"Success! A total of {total_files_extracted} file(s) have been extracted.", "grey", "on_green"))
             if not args.dry_run:
                 logging.info(f"Files saved in: {colored(str(output_dir_path), 'green')}")
@@ -5,10 +5,17 @@ Phase 2: Settings and Extensions tabs with functional controls.
 Phase 3: Tree selection and progress bar.
 """
 
+import concurrent.futures
 import logging
-import datetime
+import logging.handlers
+import os
+import queue
+import re
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Set, Optional
 
@@ -20,18 +27,212 @@ from textual.widgets import (
     Switch, Input, Label, Button, RadioSet, RadioButton, SelectionList,
     ProgressBar, Checkbox
 )
-from textual import on
+from textual import on, work
 from textual.events import Click
+from textual.worker import Worker, WorkerState
+from rich.text import Text
 
 # Import from our modules
 from . import config
 from . import file_handler
 
-# Import from our modules
-from . import config
+# Valid (possibly partial) positive decimal, checked before float() so a
+# half-typed size like "1." never pays for a raised-and-caught ValueError
+_NUM_RE = re.compile(r"^\d+(\.\d*)?$")
+
+# Panel copy pre-rendered at module load: Text.from_markup parses the
+# markup once per process, so each Static mount/redraw reuses the cached
+# Text instead of re-running the markup parser.
+_SETTINGS_HINT_TEXT = Text.from_markup(
+    "Press [b]Ctrl+R[/b] or click Run to start extraction.\n"
+    "Use the Tree tab to select specific folders (Phase 3)."
+)
+_EXCLUSIONS_PANEL_TEXT = Text.from_markup(
+    "Select folders and files to exclude from extraction. "
+    "All items start as [bold]selected[/bold] (excluded). "
+    "Press Space to toggle selection."
+)
+_EXCLUSIONS_FOOTER_TEXT = Text(
+    "Use Space to select/deselect items.\n"
+    "Selected items will be excluded from extraction."
+)
+_ALLOWED_PANEL_TEXT = Text.from_markup(
+    "Select which file extensions and specific filenames to include in extraction. "
+    "All items start as [bold]selected[/bold] (allowed). "
+    "Press Space to toggle selection."
+)
+_ALLOWED_FOOTER_TEXT = Text(
+    "Use Space to select/deselect items.\n"
+    "Selected items will be included in extraction."
+)
+_TREE_PANEL_TEXT = Text(
+    "Select folders to extract from. Navigate folders with Arrow keys. "
+    "Press Space to select/deselect a folder."
+)
 
+# Extraction status templates: .format() reuses one template string per
+# message kind, so high-frequency updates skip rebuilding the markup
+# boilerplate around the two or three values that actually change.
+_MSG_FOLDER_OK = "[green]✓ Extracted {n} file(s) from: {p}[/green]"
+_MSG_FOLDER_EMPTY = "[yellow]⚠ No extractable files in: {p}[/yellow]"
+_MSG_FOLDER_ERR = "[red]⚠ Error extracting {p}: {e}[/red]"
+_MSG_ROOT_OK = "[green]✓ Extracted {n} file(s) from root directory[/green]"
+_MSG_ROOT_EMPTY = "[yellow]⚠ No extractable files in root directory[/yellow]"
+_MSG_ROOT_ERR = "[red]⚠ Error extracting root files: {e}[/red]"
+_MSG_DONE = "[bold green]✓ Extraction complete!{sfx} Extracted {n} file(s) total.[/bold green]"
+_MSG_DONE_EMPTY = "[bold yellow]⚠ Extraction complete but no files matched criteria.{sfx}[/bold yellow]"
+
+# Group/option tables for the Exclusions and Allowed tabs, precomputed at
+# import so the tab builders only assemble widgets: every (label, value,
+# selected) tuple is built once per process instead of once per build.
+_EXCLUSION_GROUPS = (
+    ("Package Managers & Build Output", "pkg_exclusions_list", "excluded_dirs", "Excluded dir", (
+        ("node_modules          - (FOLDER) JS/Node dependencies", "node_modules", True),
+        ("vendor                - (FOLDER) PHP/Composer dependencies", "vendor", True),
+        ("__pycache__           - (FOLDER) Python bytecode cache", "__pycache__", True),
+        ("dist                  - (FOLDER) Distribution/build output", "dist", True),
+        ("build                 - (FOLDER) Build artifacts", "build", True),
+        ("target                - (FOLDER) Rust/Cargo build output", "target", True),
+        (".next                 - (FOLDER) Next.js build cache", ".next", True),
+    )),
+    ("Version Control", "vcs_exclusions_list", "excluded_dirs", "Excluded dir", (
+        (".git                  - (FOLDER) Git repository data", ".git", True),
+        (".svn                  - (FOLDER) Subversion repository data", ".svn", True),
+        (".hg                   - (FOLDER) Mercurial repository data", ".hg", True),
+    )),
+    ("Virtual Environments", "venv_exclusions_list", "excluded_dirs", "Excluded dir", (
+        ("venv                  - (FOLDER) Python virtual environment", "venv", True),
+        (".venv                 - (FOLDER) Python virtual environment", ".venv", True),
+    )),
+    ("IDE & Editor", "ide_exclusions_list", "excluded_dirs", "Excluded dir", (
+        (".vscode               - (FOLDER) VS Code settings", ".vscode", True),
+        (".idea                 - (FOLDER) JetBrains IDE settings", ".idea", True),
+    )),
+    ("Flutter/Mobile", "flutter_exclusions_list", "excluded_dirs", "Excluded dir", (
+        (".dart_tool            - (FOLDER) Dart build configuration", ".dart_tool", True),
+        (".gradle               - (FOLDER) Android Gradle cache", ".gradle", True),
+        ("Pods                  - (FOLDER) iOS CocoaPods dependencies", "Pods", True),
+        ("DerivedData           - (FOLDER) Xcode build artifacts", "DerivedData", True),
+    )),
+    ("Lock Files", "lock_files_list", "excluded_filenames", "Excluded file", (
+        ("package-lock.json     - (FILE) npm lock file", "package-lock.json", True),
+        ("yarn.lock             - (FILE) Yarn lock file", "yarn.lock", True),
+        ("composer.lock         - (FILE) PHP Composer lock file", "composer.lock", True),
+        ("Podfile.lock          - (FILE) CocoaPods lock file", "Podfile.lock", True),
+    )),
+    ("Config Files", "config_files_list", "excluded_filenames", "Excluded file", (
+        (".env                  - (FILE) Environment variables", ".env", True),
+    )),
+)
+
+_ALLOWED_GROUPS = (
+    ("Web & General", "web_general_extensions_list", "allowed_extensions", "Allowed extension", (
+        (".php                  - (EXTENSION) PHP server-side scripting", ".php", True),
+        (".html                 - (EXTENSION) HTML web markup", ".html", True),
+        (".css                  - (EXTENSION) CSS stylesheet", ".css", True),
+        (".js                   - (EXTENSION) JavaScript client-side scripting", ".js", True),
+        (".jsx                  - (EXTENSION) React JSX JavaScript", ".jsx", True),
+        (".ts                   - (EXTENSION) TypeScript typed JavaScript", ".ts", True),
+        (".tsx                  - (EXTENSION) TypeScript React JSX", ".tsx", True),
+        (".vue                  - (EXTENSION) Vue.js component", ".vue", True),
+        (".svelte               - (EXTENSION) Svelte component", ".svelte", True),
+        (".py                   - (EXTENSION) Python scripting language", ".py", True),
+        (".rb                   - (EXTENSION) Ruby scripting language", ".rb", True),
+        (".java                 - (EXTENSION) Java programming language", ".java", True),
+        (".c                    - (EXTENSION) C programming language", ".c", True),
+        (".cpp                  - (EXTENSION) C++ programming language", ".cpp", True),
+        (".cs                   - (EXTENSION) C# programming language", ".cs", True),
+        (".go                   - (EXTENSION) Go programming language", ".go", True),
+        (".rs                   - (EXTENSION) Rust programming language", ".rs", True),
+        (".json                 - (EXTENSION) JSON data format", ".json", True),
+        (".xml                  - (EXTENSION) XML markup language", ".xml", True),
+        (".yaml                 - (EXTENSION) YAML configuration format", ".yaml", True),
+        (".yml                  - (EXTENSION) YAML configuration format", ".yml", True),
+        (".toml                 - (EXTENSION) TOML configuration format", ".toml", True),
+        (".ini                  - (EXTENSION) INI configuration file", ".ini", True),
+        (".conf                 - (EXTENSION) Generic configuration file", ".conf", True),
+        (".md                   - (EXTENSION) Markdown documentation", ".md", True),
+        (".txt                  - (EXTENSION) Plain text file", ".txt", True),
+        (".rst                  - (EXTENSION) reStructuredText documentation", ".rst", True),
+        (".twig                 - (EXTENSION) Twig PHP template", ".twig", True),
+        (".blade                - (EXTENSION) Laravel Blade template", ".blade", True),
+        (".handlebars           - (EXTENSION) Handlebars template", ".handlebars", True),
+        (".mustache             - (EXTENSION) Mustache template", ".mustache", True),
+        (".ejs                  - (EXTENSION) Embedded JavaScript template", ".ejs", True),
+        (".sql                  - (EXTENSION) SQL database query", ".sql", True),
+        (".graphql              - (EXTENSION) GraphQL query language", ".graphql", True),
+        (".gql                  - (EXTENSION) GraphQL query language", ".gql", True),
+        (".tf                   - (EXTENSION) Terraform infrastructure", ".tf", True),
+    )),
+    ("Flutter / Dart / Mobile", "mobile_extensions_list", "allowed_extensions", "Allowed extension", (
+        (".dart                 - (EXTENSION) Dart Flutter language", ".dart", True),
+        (".arb                  - (EXTENSION) Flutter localization resource", ".arb", True),
+        (".gradle               - (EXTENSION) Android Gradle build script", ".gradle", True),
+        (".properties           - (EXTENSION) Java properties file", ".properties", True),
+        (".plist                - (EXTENSION) iOS property list", ".plist", True),
+        (".xcconfig             - (EXTENSION) Xcode build configuration", ".xcconfig", True),
+    )),
+    ("Scripts", "script_extensions_list", "allowed_extensions", "Allowed extension", (
+        (".sh                   - (EXTENSION) Unix/Linux shell script", ".sh", True),
+        (".bat                  - (EXTENSION) Windows batch script", ".bat", True),
+    )),
+    ("Allowed Filenames", "allowed_filenames_list", "allowed_filenames", "Allowed filename", (
+        ("dockerfile            - (FILE) Docker container configuration", "dockerfile", True),
+        (".gitignore            - (FILE) Git ignore patterns", ".gitignore", True),
+        (".htaccess             - (FILE) Apache web server config", ".htaccess", True),
+        ("makefile              - (FILE) Make build automation", "makefile", True),
+        (".dockerignore         - (FILE) Docker ignore patterns", ".dockerignore", True),
+        (".env.example          - (FILE) Environment variables template", ".env.example", True),
+        ("podfile               - (FILE) iOS CocoaPods dependencies", "podfile", True),
+        ("gemfile               - (FILE) Ruby gem dependencies", "gemfile", True),
+        ("jenkinsfile           - (FILE) Jenkins CI/CD pipeline", "jenkinsfile", True),
+        ("gradlew               - (FILE) Gradle wrapper executable", "gradlew", True),
+    )),
+)
+
+# Selection-event dispatch table derived from the group tables above, so
+# the item names exist in exactly one place. Each entry carries the
+# session attribute, log label, on/off log colors (exclusion lists log
+# red when an item is switched on), and the values the list owns.
+_LIST_ITEM_MAP = {
+    list_id: (attr, prefix)
+    + (("red", "green") if attr.startswith("excluded") else ("green", "red"))
+    + (frozenset(value for _label, value, _selected in options),)
+    for groups in (_EXCLUSION_GROUPS, _ALLOWED_GROUPS)
+    for _title, list_id, attr, prefix, options in groups
+}
+
+
+class OptionGroup(Vertical):
+    """A group header and its SelectionList mounted as one composite widget."""
+
+    def __init__(self, title, list_id, options):
+        super().__init__(classes="option-group")
+        self._title = title
+        self._list_id = list_id
+        self._options = options
+
+    def compose(self) -> ComposeResult:
+        yield Label(self._title, classes="group-header")
+        yield SelectionList(*self._options, id=self._list_id)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
+class FileFilter:
+    """
+    Immutable snapshot of the session's filtering sets.
+
+    Built once per run and handed to the extractor, so per-file checks are
+    frozenset probes against shared objects instead of re-reading (and
+    re-freezing) the mutable session sets for every unit.
+    """
+    excluded_dirs: frozenset
+    excluded_filenames: frozenset
+    allowed_filenames: frozenset
+    allowed_extensions: frozenset
+
+
+@dataclass(slots=True)
 class ExtractionSession:
     """Holds the extraction session configuration from TUI inputs."""
     exclude_large_files: bool = False
@@ -45,20 +246,20 @@ class ExtractionSession:
     # Internal progress tracking (private fields)
     _completed_units: int = field(default=0, init=False, repr=False)
 
+    # Cached FileFilter snapshot shared with the extractor; rebuilt lazily
+    # after a toggle invalidates it
+    _filter: Optional[FileFilter] = field(default=None, init=False, repr=False)
+
+    # Cached unit total for the progress path; folder/root toggles
+    # invalidate it so progress ticks never re-count the selection
+    _total_units: Optional[int] = field(default=None, init=False, repr=False)
+
     # Excluded directories (user-configurable)
-    # Default to all standard exclusions being selected (matching config.py)
-    excluded_dirs: Set[str] = field(default_factory=lambda: set([
-        # Standard exclusions
-        "node_modules", "vendor", "__pycache__", "dist", "build", "target", ".next",
-        ".git", ".svn", ".hg", ".vscode", ".idea", "venv", ".venv", ".dart_tool",
-        # Flutter/Mobile exclusions
-        ".gradle", "Pods", "DerivedData",
-    ]))
+    # Defaults copy the shared config frozensets instead of re-listing them
+    excluded_dirs: Set[str] = field(default_factory=lambda: set(config.EXCLUDED_DIRS))
 
     # Excluded filenames (lock files, config files)
-    excluded_filenames: Set[str] = field(default_factory=lambda: set([
-        "package-lock.json", "yarn.lock", "composer.lock", ".env", "Podfile.lock",
-    ]))
+    excluded_filenames: Set[str] = field(default_factory=lambda: set(config.EXCLUDED_FILENAMES))
 
     # Allowed extensions (for file filtering during extraction)
     allowed_extensions: Set[str] = field(default_factory=lambda: set(config.ALLOWED_EXTENSIONS))
@@ -69,7 +270,13 @@ class ExtractionSession:
     @property
     def total_units(self) -> int:
         """Total number of extraction units (folders + optional root)."""
-        return len(self.selected_folders) + (1 if self.include_root_files else 0)
+        if self._total_units is None:
+            self._total_units = len(self.selected_folders) + (1 if self.include_root_files else 0)
+        return self._total_units
+
+    def invalidate_total_units(self) -> None:
+        """Drops the cached unit total after the selection changed."""
+        self._total_units = None
 
     @property
     def completed_units(self) -> int:
@@ -81,9 +288,20 @@ class ExtractionSession:
         """Set completed units, ensuring it never exceeds total."""
         self._completed_units = min(value, self.total_units)
 
-    def get_excluded_dirs(self) -> Set[str]:
-        """Get excluded directories based on user configuration."""
-        return self.excluded_dirs
+    def build_filter(self) -> FileFilter:
+        """Returns the cached FileFilter, rebuilding it after invalidation."""
+        if self._filter is None:
+            self._filter = FileFilter(
+                excluded_dirs=frozenset(self.excluded_dirs),
+                excluded_filenames=frozenset(self.excluded_filenames),
+                allowed_filenames=frozenset(self.allowed_filenames),
+                allowed_extensions=frozenset(self.allowed_extensions),
+            )
+        return self._filter
+
+    def invalidate_filter(self) -> None:
+        """Drops the cached FileFilter after any filtering set was mutated."""
+        self._filter = None
 
     def progress_fraction(self) -> float:
         """Get progress as a fraction (0.0 to 1.0)."""
@@ -102,83 +320,46 @@ class CodebaseExtractorApp(App):
         Binding("q", "app.quit", "Quit"),
     ]
 
-    CSS = """
-    #settings_container {
-        layout: vertical;
-    }
-
-    .section-border {
-        border: round cyan;
-        padding: 1;
-        margin: 1 0;
-    }
-
-    .info-text {
-        text-style: dim;
-        text-style: italic;
-    }
-
-    .hint-text {
-        text-style: dim;
-        margin: 1 2;
-    }
-
-    .button-row {
-        align: center middle;
-        height: 3;
-    }
-
-    .exclusions-container {
-        padding: 0 2;
-    }
-
-    .exclusion-group {
-        border: round cyan;
-        padding: 1;
-        margin: 1 0;
-    }
-
-    .group-header {
-        text-style: bold;
-    }
-
-    Checkbox {
-        margin: 0 0 0 0;
-    }
-
-    #tree_selection {
-        height: 1fr;
-    }
-
-    #tree_container {
-        
-    }
-
-    ProgressBar {
-        margin: 1 2;
-    }
-
-    #progress_container {
-        padding: 1 2;
-    }
-
-    .progress-text {
-        text-align: center;
-        margin: 1 0;
-    }
-
-    .status-box {
-        border: round cyan;
-        padding: 1;
-        margin: 1 0;
-    }
-    """
+    # Stylesheet lives in tui.tcss; Textual parses external CSS once and
+    # caches the compiled rules across app instances.
+    CSS_PATH = "tui.tcss"
 
     def __init__(self, **kwargs):
         """Initialize the app."""
         super().__init__(**kwargs)
         self.session = ExtractionSession()
         self.root_path = Path.cwd()
+        # Tab panes whose bodies are built on first activation, so startup
+        # only pays for composing the Settings tab
+        self._built_tabs = set()
+        self._lazy_tab_builders = {
+            "exclusions_tab": self._build_exclusions_body,
+            "allowed_tab": self._build_allowed_body,
+            "tree_tab": self._build_tree_body,
+        }
+        # Debounce timers (keyed by Input id) so handlers run once typing
+        # settles instead of parsing/logging on every keystroke
+        self._input_debounce = {}
+        # Last observed selection per SelectionList, so change events diff
+        # against a cached frozenset instead of rescanning the whole group
+        self._prev_selected = {}
+        # Folder checkboxes cached at tree-build time, so select-all works
+        # from a plain list instead of filtering DOM children per toggle
+        self._folder_checkboxes = []
+        # SelectionLists per pane, resolved once after the pane is built so
+        # repeat tab visits clear highlights without re-running the query
+        self._pane_selection_lists = {}
+        # Select-all checkbox reference, set when the folder tree is built
+        self._select_all_checkbox = None
+        # Run-path widgets, captured when the Tree tab body is built
+        self._progress_container = None
+        self._progress_bar = None
+        self._progress_text = None
+        self._status = None
+        self._run_btn = None
+        # Checked once: when nothing consumes textual debug logging, the
+        # handlers skip building their log strings entirely
+        self._log_enabled = logging.getLogger("textual").isEnabledFor(logging.DEBUG)
 
     def compose(self) -> ComposeResult:
         """Compose the UI."""
@@ -190,12 +371,10 @@ class CodebaseExtractorApp(App):
 
                 # Info section
                 Static(f"Root directory: {self.root_path}", classes="info-text"),
-                Static(),
 
                 # Output Directory Section
                 Vertical(
                     Static("Output will be saved to a subdirectory of the root above.", classes="info-text"),
-                    Static(),
                     Static("Folder name:"),
                     Input(
                         value=config.OUTPUT_DIR_NAME,
@@ -205,7 +384,6 @@ class CodebaseExtractorApp(App):
                     id="output_dir_section",
                     classes="section-border",
                 ),
-                Static(),
 
                 # File Size Exclusion Section
                 Vertical(
@@ -222,7 +400,6 @@ class CodebaseExtractorApp(App):
                     id="large_file_section",
                     classes="section-border",
                 ),
-                Static(),
 
                 # Dry Run Section
                 Vertical(
@@ -234,8 +411,6 @@ class CodebaseExtractorApp(App):
                     id="dry_run_section",
                     classes="section-border",
                 ),
-                Static(),
-                Static(),
 
                 # Action Buttons
                 Horizontal(
@@ -243,203 +418,62 @@ class CodebaseExtractorApp(App):
                     Button("Quit", id="quit_button"),
                     classes="button-row",
                 ),
-                Static(),
-                Static(
-                    "Press [b]Ctrl+R[/b] or click Run to start extraction.\n"
-                    "Use the Tree tab to select specific folders (Phase 3).",
-                    classes="hint-text"
-                ),
+                Static(_SETTINGS_HINT_TEXT, classes="hint-text"),
                 id="settings_container"
             ), id="settings_tab")
 
-            # Exclusions Tab with SelectionLists
-            yield TabPane("Excluded: Folders & Files", VerticalScroll(
+            # The remaining tab bodies are heavy (SelectionLists, tree); they
+            # are mounted lazily on first activation
+            yield TabPane("Excluded: Folders & Files", Static("Loading...", classes="hint-text"), id="exclusions_tab")
+            yield TabPane("Allowed: Extensions & Specific Files", Static("Loading...", classes="hint-text"), id="allowed_tab")
+            yield TabPane("Tree", Static("Loading...", classes="hint-text"), id="tree_tab")
+        yield Footer()
+
+    @staticmethod
+    def _compose_group_widgets(groups: tuple) -> list:
+        """Turns a precomputed group table into OptionGroup widgets."""
+        return [
+            OptionGroup(title, list_id, options)
+            for title, list_id, _attr, _prefix, options in groups
+        ]
+
+    def _build_exclusions_body(self) -> VerticalScroll:
+        """Builds the Exclusions tab body (deferred until first activation)."""
+        return VerticalScroll(
                 Label("Excluded Folders & Files", classes="header"),
-                Static(
-                    "Select folders and files to exclude from extraction. "
-                    "All items start as [bold]selected[/bold] (excluded). "
-                    "Press Space to toggle selection.",
-                    classes="hint"
-                ),
-                Static(),
-                # Standard exclusions
-                Label("Package Managers & Build Output", classes="group-header"),
-                SelectionList(
-                    ("node_modules          - (FOLDER) JS/Node dependencies", "node_modules", True),
-                    ("vendor                - (FOLDER) PHP/Composer dependencies", "vendor", True),
-                    ("__pycache__           - (FOLDER) Python bytecode cache", "__pycache__", True),
-                    ("dist                  - (FOLDER) Distribution/build output", "dist", True),
-                    ("build                 - (FOLDER) Build artifacts", "build", True),
-                    ("target                - (FOLDER) Rust/Cargo build output", "target", True),
-                    (".next                 - (FOLDER) Next.js build cache", ".next", True),
-                    id="pkg_exclusions_list",
-                ),
-                Static(),
-                # Version Control
-                Label("Version Control", classes="group-header"),
-                SelectionList(
-                    (".git                  - (FOLDER) Git repository data", ".git", True),
-                    (".svn                  - (FOLDER) Subversion repository data", ".svn", True),
-                    (".hg                   - (FOLDER) Mercurial repository data", ".hg", True),
-                    id="vcs_exclusions_list",
-                ),
-                Static(),
-                # Virtual Environments
-                Label("Virtual Environments", classes="group-header"),
-                SelectionList(
-                    ("venv                  - (FOLDER) Python virtual environment", "venv", True),
-                    (".venv                 - (FOLDER) Python virtual environment", ".venv", True),
-                    id="venv_exclusions_list",
-                ),
-                Static(),
-                # IDE & Editor
-                Label("IDE & Editor", classes="group-header"),
-                SelectionList(
-                    (".vscode               - (FOLDER) VS Code settings", ".vscode", True),
-                    (".idea                 - (FOLDER) JetBrains IDE settings", ".idea", True),
-                    id="ide_exclusions_list",
-                ),
-                Static(),
-                # Flutter/Mobile exclusions
-                Label("Flutter/Mobile", classes="group-header"),
-                SelectionList(
-                    (".dart_tool            - (FOLDER) Dart build configuration", ".dart_tool", True),
-                    (".gradle               - (FOLDER) Android Gradle cache", ".gradle", True),
-                    ("Pods                  - (FOLDER) iOS CocoaPods dependencies", "Pods", True),
-                    ("DerivedData           - (FOLDER) Xcode build artifacts", "DerivedData", True),
-                    id="flutter_exclusions_list",
-                ),
-                Static(),
-                # Lock Files
-                Label("Lock Files", classes="group-header"),
-                SelectionList(
-                    ("package-lock.json     - (FILE) npm lock file", "package-lock.json", True),
-                    ("yarn.lock             - (FILE) Yarn lock file", "yarn.lock", True),
-                    ("composer.lock         - (FILE) PHP Composer lock file", "composer.lock", True),
-                    ("Podfile.lock          - (FILE) CocoaPods lock file", "Podfile.lock", True),
-                    id="lock_files_list",
-                ),
-                Static(),
-                # Config Files
-                Label("Config Files", classes="group-header"),
-                SelectionList(
-                    (".env                  - (FILE) Environment variables", ".env", True),
-                    id="config_files_list",
-                ),
-                Static(),
-                Static(
-                    "Use Space to select/deselect items.\n"
-                    "Selected items will be excluded from extraction.",
-                    classes="hint"
-                ),
+                Static(_EXCLUSIONS_PANEL_TEXT, classes="hint"),
+                *self._compose_group_widgets(_EXCLUSION_GROUPS),
+                Static(_EXCLUSIONS_FOOTER_TEXT, classes="hint"),
                 id="exclusions_container"
-            ), id="exclusions_tab")
+            )
 
-            # Allowed Extensions & Files Tab
-            yield TabPane("Allowed: Extensions & Specific Files", VerticalScroll(
+    def _build_allowed_body(self) -> VerticalScroll:
+        """Builds the Allowed tab body (deferred until first activation)."""
+        return VerticalScroll(
                 Label("Allowed Extensions & Specific Files", classes="header"),
-                Static(
-                    "Select which file extensions and specific filenames to include in extraction. "
-                    "All items start as [bold]selected[/bold] (allowed). "
-                    "Press Space to toggle selection.",
-                    classes="hint"
-                ),
-                Static(),
-                # Web & General extensions
-                Label("Web & General", classes="group-header"),
-                SelectionList(
-                    (".php                  - (EXTENSION) PHP server-side scripting", ".php", True),
-                    (".html                 - (EXTENSION) HTML web markup", ".html", True),
-                    (".css                  - (EXTENSION) CSS stylesheet", ".css", True),
-                    (".js                   - (EXTENSION) JavaScript client-side scripting", ".js", True),
-                    (".jsx                  - (EXTENSION) React JSX JavaScript", ".jsx", True),
-                    (".ts                   - (EXTENSION) TypeScript typed JavaScript", ".ts", True),
-                    (".tsx                  - (EXTENSION) TypeScript React JSX", ".tsx", True),
-                    (".vue                  - (EXTENSION) Vue.js component", ".vue", True),
-                    (".svelte               - (EXTENSION) Svelte component", ".svelte", True),
-                    (".py                   - (EXTENSION) Python scripting language", ".py", True),
-                    (".rb                   - (EXTENSION) Ruby scripting language", ".rb", True),
-                    (".java                 - (EXTENSION) Java programming language", ".java", True),
-                    (".c                    - (EXTENSION) C programming language", ".c", True),
-                    (".cpp                  - (EXTENSION) C++ programming language", ".cpp", True),
-                    (".cs                   - (EXTENSION) C# programming language", ".cs", True),
-                    (".go                   - (EXTENSION) Go programming language", ".go", True),
-                    (".rs                   - (EXTENSION) Rust programming language", ".rs", True),
-                    (".json                 - (EXTENSION) JSON data format", ".json", True),
-                    (".xml                  - (EXTENSION) XML markup language", ".xml", True),
-                    (".yaml                 - (EXTENSION) YAML configuration format", ".yaml", True),
-                    (".yml                  - (EXTENSION) YAML configuration format", ".yml", True),
-                    (".toml                 - (EXTENSION) TOML configuration format", ".toml", True),
-                    (".ini                  - (EXTENSION) INI configuration file", ".ini", True),
-                    (".conf                 - (EXTENSION) Generic configuration file", ".conf", True),
-                    (".md                   - (EXTENSION) Markdown documentation", ".md", True),
-                    (".txt                  - (EXTENSION) Plain text file", ".txt", True),
-                    (".rst                  - (EXTENSION) reStructuredText documentation", ".rst", True),
-                    (".twig                 - (EXTENSION) Twig PHP template", ".twig", True),
-                    (".blade                - (EXTENSION) Laravel Blade template", ".blade", True),
-                    (".handlebars           - (EXTENSION) Handlebars template", ".handlebars", True),
-                    (".mustache             - (EXTENSION) Mustache template", ".mustache", True),
-                    (".ejs                  - (EXTENSION) Embedded JavaScript template", ".ejs", True),
-                    (".sql                  - (EXTENSION) SQL database query", ".sql", True),
-                    (".graphql              - (EXTENSION) GraphQL query language", ".graphql", True),
-                    (".gql                  - (EXTENSION) GraphQL query language", ".gql", True),
-                    (".tf                   - (EXTENSION) Terraform infrastructure", ".tf", True),
-                    id="web_general_extensions_list",
-                ),
-                Static(),
-                # Flutter/Mobile extensions
-                Label("Flutter / Dart / Mobile", classes="group-header"),
-                SelectionList(
-                    (".dart                 - (EXTENSION) Dart Flutter language", ".dart", True),
-                    (".arb                  - (EXTENSION) Flutter localization resource", ".arb", True),
-                    (".gradle               - (EXTENSION) Android Gradle build script", ".gradle", True),
-                    (".properties           - (EXTENSION) Java properties file", ".properties", True),
-                    (".plist                - (EXTENSION) iOS property list", ".plist", True),
-                    (".xcconfig             - (EXTENSION) Xcode build configuration", ".xcconfig", True),
-                    id="mobile_extensions_list",
-                ),
-                Static(),
-                # Script extensions
-                Label("Scripts", classes="group-header"),
-                SelectionList(
-                    (".sh                   - (EXTENSION) Unix/Linux shell script", ".sh", True),
-                    (".bat                  - (EXTENSION) Windows batch script", ".bat", True),
-                    id="script_extensions_list",
-                ),
-                Static(),
-                # Allowed filenames
-                Label("Allowed Filenames", classes="group-header"),
-                SelectionList(
-                    ("dockerfile            - (FILE) Docker container configuration", "dockerfile", True),
-                    (".gitignore            - (FILE) Git ignore patterns", ".gitignore", True),
-                    (".htaccess             - (FILE) Apache web server config", ".htaccess", True),
-                    ("makefile              - (FILE) Make build automation", "makefile", True),
-                    (".dockerignore         - (FILE) Docker ignore patterns", ".dockerignore", True),
-                    (".env.example          - (FILE) Environment variables template", ".env.example", True),
-                    ("podfile               - (FILE) iOS CocoaPods dependencies", "podfile", True),
-                    ("gemfile               - (FILE) Ruby gem dependencies", "gemfile", True),
-                    ("jenkinsfile           - (FILE) Jenkins CI/CD pipeline", "jenkinsfile", True),
-                    ("gradlew               - (FILE) Gradle wrapper executable", "gradlew", True),
-                    id="allowed_filenames_list",
-                ),
-                Static(),
-                Static(
-                    "Use Space to select/deselect items.\n"
-                    "Selected items will be included in extraction.",
-                    classes="hint"
-                ),
+                Static(_ALLOWED_PANEL_TEXT, classes="hint"),
+                *self._compose_group_widgets(_ALLOWED_GROUPS),
+                Static(_ALLOWED_FOOTER_TEXT, classes="hint"),
                 id="allowed_container"
-            ), id="allowed_tab")
+            )
 
-            # Tree Tab (Phase 3)
-            yield TabPane("Tree", Vertical(
+    def _build_tree_body(self) -> Vertical:
+        """Builds the Tree tab body (deferred until first activation)."""
+        # The run path touches these on every click; keep direct references
+        # from construction so it never pays for a query_one CSS walk.
+        # Progress widgets are built once here and reset per run, instead of
+        # being destroyed and re-mounted on every Run click.
+        self._progress_bar = ProgressBar(id="progress_bar", total=100, show_percentage=True, show_eta=False)
+        self._progress_text = Static("", id="progress_text", classes="progress-text")
+        self._progress_container = Vertical(
+            self._progress_bar, self._progress_text,
+            id="progress_container", classes="progress_container",
+        )
+        self._status = Static("", id="extraction_status")
+        self._run_btn = Button("Run Extraction", variant="primary", id="tree_run_button")
+        return Vertical(
                 Label("Folder Selection", classes="header"),
-                Static(
-                    "Select folders to extract from. Navigate folders with Arrow keys. "
-                    "Press Space to select/deselect a folder.",
-                    classes="hint-text"
-                ),
-                Static(),
+                Static(_TREE_PANEL_TEXT, classes="hint-text"),
 
                 # Root files checkbox
                 Horizontal(
@@ -450,29 +484,24 @@ class CodebaseExtractorApp(App):
                     ),
                     classes="status-box",
                 ),
-                Static(),
 
                 # Folder tree (built dynamically on mount)
                 VerticalScroll(id="tree_selection"),
-                Static(),
 
                 # Progress bar (hidden initially)
-                Vertical(id="progress_container", classes="progress_container"),
-                Static(),
+                self._progress_container,
 
                 # Status text for extraction
-                Static("", id="extraction_status"),
-                Static(),
+                self._status,
 
                 # Action buttons
                 Horizontal(
-                    Button("Run Extraction", variant="primary", id="tree_run_button"),
+                    self._run_btn,
                     Button("Back to Settings", id="tree_back_button"),
                     classes="button-row",
                 ),
                 id="tree_container"
-            ), id="tree_tab")
-        yield Footer()
+            )
 
     def on_mount(self) -> None:
         """Set up the UI after mounting."""
@@ -481,46 +510,69 @@ class CodebaseExtractorApp(App):
         self.query_one("#large_file_section").border_title = "Large File Exclusion"
         self.query_one("#dry_run_section").border_title = "Dry-run Execution Mode (designed for testing purposes)"
 
+        # Cache the hot Settings and run-path widgets so run actions skip
+        # repeated DOM queries and CSS-selector matching
+        self._rb_dry = self.query_one("#dry_run_enabled", RadioButton)
+        self._in_out = self.query_one("#output_dir_input", Input)
+        self._in_size = self.query_one("#max_file_size_input", Input)
+        self._tabs = self.query_one(TabbedContent)
+
+        # One deferred callback handles all post-layout cleanup rather than
+        # queueing a separate call_after_refresh per step
+        self.call_after_refresh(self._post_mount_init)
+
+    def _post_mount_init(self) -> None:
+        """Post-layout cleanup run once after the first refresh."""
         # Clear initial highlight from all SelectionLists
-        self.call_after_refresh(self._clear_selection_list_highlights)
+        self._clear_selection_list_highlights()
         # Clear initial focus from Settings controls (e.g. Dry-run RadioSet)
-        self.call_after_refresh(self._clear_focus)
-
-        # Build the folder tree for the Tree tab
-        self.call_after_refresh(self._build_folder_tree)
+        self._clear_focus()
 
     def _build_folder_tree(self) -> None:
         """Build the folder tree in the Tree tab."""
         tree_container = self.query_one("#tree_selection", VerticalScroll)
         tree_container.remove_children()
 
-        # Get immediate subdirectories of root (non-recursive for simplicity)
-        # We only show directories that are not excluded
-        subdirs = sorted([
-            p for p in self.root_path.iterdir()
-            if p.is_dir() and p.name not in config.EXCLUDED_DIRS
-        ])
+        # Get immediate subdirectories of root (non-recursive for simplicity).
+        # scandir's cached metadata filters excluded/non-dir entries without
+        # per-entry stat() calls, and only kept entries become Paths.
+        excluded = config.EXCLUDED_DIRS
+        with os.scandir(self.root_path) as it:
+            subdirs = sorted(
+                (Path(entry.path) for entry in it
+                 if entry.name not in excluded and entry.is_dir(follow_symlinks=False)),
+                key=lambda p: p.name,
+            )
 
         if not subdirs:
             tree_container.mount(Static("[dim]No folders found in root directory.[/dim]"))
             return
 
-        # Add a select all checkbox at the top
-        tree_container.mount(
+        # Add a select all checkbox at the top (reference kept so folder
+        # toggles can uncheck it without a DOM query)
+        self._select_all_checkbox = Checkbox(label="Select All Folders", id="select_all_checkbox", value=False)
+        widgets = [
             Horizontal(
-                Checkbox(label="Select All Folders", id="select_all_checkbox", value=False),
+                self._select_all_checkbox,
                 classes="status-box",
             )
-        )
-        tree_container.mount(Static())
+        ]
 
         # Add checkboxes for each folder
+        self._folder_checkboxes = []
         for subdir in subdirs:
             # Sanitize folder name for ID (replace . with _ to satisfy Textual ID rules)
             safe_id = f"folder_{subdir.name.replace('.', '_')}"
-            tree_container.mount(
-                Checkbox(label=f"📁 {subdir.name}", value=False, id=safe_id)
-            )
+            checkbox = Checkbox(label=f"📁 {subdir.name}", value=False, id=safe_id)
+            # Keep the real path on the widget so toggle handlers never have
+            # to recover it by re-rendering and parsing the label
+            checkbox.folder_path = subdir
+            self._folder_checkboxes.append(checkbox)
+            widgets.append(checkbox)
+
+        # One mount_all call gives Textual a single layout/refresh pass for
+        # the whole list instead of one per checkbox
+        tree_container.mount_all(widgets)
 
         # Clear focus from all checkboxes
         self.call_after_refresh(self._clear_focus)
@@ -532,8 +584,11 @@ class CodebaseExtractorApp(App):
 
     def _clear_selection_list_highlights_in_pane(self, pane_id: str) -> None:
         """Clear SelectionList highlight only within a specific tab pane."""
-        pane = self.query_one(f"#{pane_id}")
-        for selection_list in pane.query(SelectionList):
+        lists = self._pane_selection_lists.get(pane_id)
+        if lists is None:
+            pane = self.query_one(f"#{pane_id}")
+            lists = self._pane_selection_lists[pane_id] = list(pane.query(SelectionList))
+        for selection_list in lists:
             selection_list.highlighted = None
 
     def _clear_focus(self) -> None:
@@ -541,7 +596,16 @@ class CodebaseExtractorApp(App):
         self.set_focus(None)
 
     def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
-        """Clear focus when entering Settings so Dry-run does not auto-highlight."""
+        """Builds lazy tab bodies on first visit and manages focus/highlights."""
+        pane_id = event.pane.id
+        if pane_id in self._lazy_tab_builders and pane_id not in self._built_tabs:
+            self._built_tabs.add(pane_id)
+            event.pane.remove_children()
+            event.pane.mount(self._lazy_tab_builders[pane_id]())
+            if pane_id == "tree_tab":
+                # The folder tree scan also waits for the first visit
+                self.call_after_refresh(self._build_folder_tree)
+
         if event.pane.id == "settings_tab":
             self.call_after_refresh(self._clear_focus)
         elif event.pane.id in {"exclusions_tab", "allowed_tab"}:
@@ -551,151 +615,173 @@ class CodebaseExtractorApp(App):
 
     def on_switch_changed(self, event: Switch.Changed) -> None:
         """Handle switch toggle changes."""
-        if event.switch.id == "exclude_large_switch":
+        if event.switch.id == "exclude_large_switch" and self.session.exclude_large_files != event.value:
             self.session.exclude_large_files = event.value
-            self.log(f"Exclude large files: {event.value}")
+            if self._log_enabled:
+                self.log(f"Exclude large files: {event.value}")
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle checkbox changes."""
         # Handle root files checkbox
         if event.checkbox.id == "root_files_checkbox":
-            self.session.include_root_files = event.value
-            self.log(f"Include root files: {event.value}")
+            if self.session.include_root_files != event.value:
+                self.session.include_root_files = event.value
+                self.session.invalidate_total_units()
+                if self._log_enabled:
+                    self.log(f"Include root files: {event.value}")
 
         # Handle select all checkbox
         elif event.checkbox.id == "select_all_checkbox":
             select_all = event.value
-            # Update all folder checkboxes
-            # Update all folder checkboxes
-            children = self.query_one("#tree_selection", VerticalScroll).children
-            for child in children:
-                if isinstance(child, Checkbox) and child.id and child.id.startswith("folder_"):
-                    child.value = select_all
-                    # Update session - relying on label for name recovery
-                    folder_name = str(child.label).replace("📁 ", "")
-                    folder_path = self.root_path / folder_name
-                    if select_all:
-                        self.session.selected_folders.add(folder_path)
-                    else:
-                        self.session.selected_folders.discard(folder_path)
+            # Bulk-update the session with one set op, then sync the cached
+            # checkboxes (their change events become idempotent no-ops)
+            folder_paths = {cb.folder_path for cb in self._folder_checkboxes}
+            if select_all:
+                self.session.selected_folders |= folder_paths
+            else:
+                self.session.selected_folders -= folder_paths
+            self.session.invalidate_total_units()
+            for checkbox in self._folder_checkboxes:
+                checkbox.value = select_all
 
         # Handle individual folder checkbox
         elif event.checkbox.id and event.checkbox.id.startswith("folder_"):
-            # We can't easily reconstruction original name from sanitized ID if there are collisions,
-            # but for this fix we assume simple . -> _ replacement.
-            # Ideally we would map IDs to paths, but let's try to recover the name from the label?
-            # The label is "📁 {subdir.name}".
-            folder_name = str(event.checkbox.label).replace("📁 ", "")
-            folder_path = self.root_path / folder_name
-            if event.value:
-                self.session.selected_folders.add(folder_path)
-            else:
-                self.session.selected_folders.discard(folder_path)
+            self._set_folder_selected(event.checkbox, event.value)
+            if not event.value:
                 # Also deselect "Select All" if a folder is deselected
-                select_all = self.query_one("#select_all_checkbox", Checkbox)
-                if select_all.value:
-                    select_all.value = False
+                if self._select_all_checkbox.value:
+                    self._select_all_checkbox.value = False
+
+    def _set_folder_selected(self, checkbox: Checkbox, selected: bool) -> None:
+        """Syncs one folder checkbox into the session's selected_folders set."""
+        if selected:
+            self.session.selected_folders.add(checkbox.folder_path)
+        else:
+            self.session.selected_folders.discard(checkbox.folder_path)
+        self.session.invalidate_total_units()
 
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         """Handle radio button changes."""
         if event.radio_set.id == "dry_run_radioset":
             # Enabled = dry run, Disabled = normal run
-            self.session.dry_run = (event.radio_set.query_one("#dry_run_enabled").value)
-            self.log(f"Dry run: {self.session.dry_run}")
+            self.session.dry_run = self._rb_dry.value
+            if self._log_enabled:
+                self.log(f"Dry run: {self.session.dry_run}")
+
+    # Input id -> commit-method name, resolved via one dict probe per
+    # keystroke instead of an id comparison chain
+    _INPUT_COMMITS = {
+        "output_dir_input": "_commit_output_dir",
+        "max_file_size_input": "_commit_max_size",
+    }
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle input field changes."""
-        if event.input.id == "output_dir_input":
-            self.session.output_dir_name = event.value or config.OUTPUT_DIR_NAME
-            self.log(f"Output directory: {event.value}")
-        elif event.input.id == "max_file_size_input":
-            try:
-                self.session.max_file_size_mb = float(event.value) if event.value else 1.0
-                self.log(f"Max file size: {self.session.max_file_size_mb} MB")
-            except ValueError:
-                pass
+        """Handle input field changes (debounced until typing settles)."""
+        input_id = event.input.id
+        commit_name = self._INPUT_COMMITS.get(input_id)
+        if commit_name is None:
+            return
+        timer = self._input_debounce.get(input_id)
+        if timer is not None:
+            timer.stop()
+        commit = getattr(self, commit_name)
+        self._input_debounce[input_id] = self.set_timer(0.15, lambda v=event.value: commit(v))
+
+    def _flush_pending_inputs(self) -> None:
+        """Commits debounced Input edits immediately (used before a run)."""
+        timer = self._input_debounce.pop("output_dir_input", None)
+        if timer is not None:
+            timer.stop()
+            self._commit_output_dir(self._in_out.value)
+        timer = self._input_debounce.pop("max_file_size_input", None)
+        if timer is not None:
+            timer.stop()
+            self._commit_max_size(self._in_size.value)
+
+    def _commit_output_dir(self, value: str) -> None:
+        """Applies the settled output-dir input to the session."""
+        self._input_debounce.pop("output_dir_input", None)
+        new_name = value or config.OUTPUT_DIR_NAME
+        if self.session.output_dir_name != new_name:
+            self.session.output_dir_name = new_name
+            if self._log_enabled:
+                self.log(f"Output directory: {value}")
+
+    def _commit_max_size(self, value: str) -> None:
+        """Applies the settled max-file-size input to the session."""
+        self._input_debounce.pop("max_file_size_input", None)
+        value = value.strip()
+        if value and not _NUM_RE.match(value):
+            # Keep the last valid size and flag the field instead of raising
+            self._in_size.add_class("-invalid")
+            return
+        self._in_size.remove_class("-invalid")
+        new_size = float(value) if value else 1.0
+        if self.session.max_file_size_mb != new_size:
+            self.session.max_file_size_mb = new_size
+            if self._log_enabled:
+                self.log(f"Max file size: {new_size} MB")
 
     def on_selection_list_selected_changed(self, event: SelectionList.SelectedChanged) -> None:
         """Handle SelectionList selection changes (excluded folders/files, allowed extensions)."""
-        selection_list = event.selection_list
-        selected_values = selection_list.selected
-
-        # Map SelectionList IDs to their items
-        list_id = selection_list.id
-        item_map = {
-            # Excluded Directories
-            "pkg_exclusions_list": ("excluded_dirs", ["node_modules", "vendor", "__pycache__", "dist", "build", "target", ".next"]),
-            "vcs_exclusions_list": ("excluded_dirs", [".git", ".svn", ".hg"]),
-            "venv_exclusions_list": ("excluded_dirs", ["venv", ".venv"]),
-            "ide_exclusions_list": ("excluded_dirs", [".vscode", ".idea"]),
-            "flutter_exclusions_list": ("excluded_dirs", [".dart_tool", ".gradle", "Pods", "DerivedData"]),
-            # Excluded Filenames
-            "lock_files_list": ("excluded_filenames", ["package-lock.json", "yarn.lock", "composer.lock", "Podfile.lock"]),
-            "config_files_list": ("excluded_filenames", [".env"]),
-            # Allowed Extensions
-            "web_general_extensions_list": ("allowed_extensions", [
-                ".php", ".html", ".css", ".js", ".jsx", ".ts", ".tsx", ".vue", ".svelte",
-                ".py", ".rb", ".java", ".c", ".cpp", ".cs", ".go", ".rs", ".json", ".xml",
-                ".yaml", ".yml", ".toml", ".ini", ".conf", ".md", ".txt", ".rst", ".twig",
-                ".blade", ".handlebars", ".mustache", ".ejs", ".sql", ".graphql", ".gql", ".tf",
-            ]),
-            "mobile_extensions_list": ("allowed_extensions", [".dart", ".arb", ".gradle", ".properties", ".plist", ".xcconfig"]),
-            "script_extensions_list": ("allowed_extensions", [".sh", ".bat"]),
-            # Allowed Filenames
-            "allowed_filenames_list": ("allowed_filenames", [
-                "dockerfile", ".gitignore", ".htaccess", "makefile", ".dockerignore",
-                ".env.example", "podfile", "gemfile", "jenkinsfile", "gradlew",
-            ]),
-        }
-
-        if list_id not in item_map:
+        list_id = event.selection_list.id
+        mapping = _LIST_ITEM_MAP.get(list_id)
+        if mapping is None:
             return
 
-        session_attr, expected_items = item_map[list_id]
-
-        # Get the session set to update
-        if session_attr == "excluded_dirs":
-            session_set = self.session.excluded_dirs
-            label_prefix = "Excluded dir"
-        elif session_attr == "excluded_filenames":
-            session_set = self.session.excluded_filenames
-            label_prefix = "Excluded file"
-        elif session_attr == "allowed_extensions":
-            session_set = self.session.allowed_extensions
-            label_prefix = "Allowed extension"
-        else:  # allowed_filenames
-            session_set = self.session.allowed_filenames
-            label_prefix = "Allowed filename"
-
-        # Update session based on selection
-        for item in expected_items:
-            is_selected = item in selected_values
-            if is_selected:
-                if item not in session_set:
-                    session_set.add(item)
-                    color = "red" if "excluded" in label_prefix else "green"
-                    self.log(f"[{color}]{label_prefix}:[/{color}] {item}")
-            else:
-                if item in session_set:
-                    session_set.discard(item)
-                    color = "green" if "excluded" in label_prefix else "red"
-                    self.log(f"[{color}]Not {label_prefix}:[/{color}] {item}")
+        session_attr, label_prefix, on_color, off_color, expected_items = mapping
+        session_set = getattr(self.session, session_attr)
+
+        # Diff against the last observed selection for this list; each event
+        # then costs O(toggled items) rather than O(items in the group). The
+        # expected_items frozenset seeds the initial state directly (lists
+        # start fully selected). A no-op event exits before any log
+        # formatting or cache invalidation happens.
+        prev = self._prev_selected.get(list_id)
+        if prev is None:
+            prev = expected_items
+        curr = frozenset(event.selection_list.selected)
+        if curr == prev:
+            return
+        self._prev_selected[list_id] = curr
+        to_add = curr - prev
+        to_remove = prev - curr
+
+        # At most two summary lines per event, so bulk toggles cost O(1)
+        # log writes instead of one per changed item
+        if self._log_enabled:
+            if to_add:
+                self.log(f"[{on_color}]+{len(to_add)} {label_prefix}:[/{on_color}] {', '.join(sorted(to_add))}")
+            if to_remove:
+                self.log(f"[{off_color}]-{len(to_remove)} {label_prefix}:[/{off_color}] {', '.join(sorted(to_remove))}")
+
+        session_set.update(to_add)
+        session_set.difference_update(to_remove)
+        self.session.invalidate_filter()
+
+    # Button id -> handler-method name, same dict-dispatch shape as the
+    # Input commits above
+    _BUTTON_ACTIONS = {
+        "run_button": "action_run_extraction",
+        "quit_button": "exit",
+        "tree_run_button": "_run_extraction_from_tree",
+        "tree_back_button": "_back_to_settings",
+    }
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "run_button":
-            self.action_run_extraction()
-        elif event.button.id == "quit_button":
-            self.exit()
-        elif event.button.id == "tree_run_button":
-            self._run_extraction_from_tree()
-        elif event.button.id == "tree_back_button":
-            self.query_one(TabbedContent).active = "settings_tab"
+        action = self._BUTTON_ACTIONS.get(event.button.id)
+        if action is not None:
+            getattr(self, action)()
+
+    def _back_to_settings(self) -> None:
+        """Returns from the Tree tab to the Settings tab."""
+        self._tabs.active = "settings_tab"
 
     def action_run_extraction(self) -> None:
         """Handle run extraction action from Settings tab."""
         # Switch to Tree tab to select folders
-        self.query_one(TabbedContent).active = "tree_tab"
+        self._tabs.active = "tree_tab"
 
     def _run_extraction_from_tree(self) -> None:
         """
@@ -711,44 +797,41 @@ class CodebaseExtractorApp(App):
         # Edge case: No folders selected and root files not included
         if not self.session.selected_folders and not self.session.include_root_files:
             self.bell()
-            status = self.query_one("#extraction_status", Static)
-            status.update("[bold red]Please select at least one folder or enable 'Include root files'.[/bold red]")
+            self._status.update("[bold red]Please select at least one folder or enable 'Include root files'.[/bold red]")
             return
 
-        # Update session from current UI values
-        exclude_large = self.query_one("#exclude_large_switch", Switch).value
-        dry_run_enabled = self.query_one("#dry_run_enabled", RadioButton).value
-        output_dir = self.query_one("#output_dir_input", Input).value
-        max_size_input = self.query_one("#max_file_size_input", Input).value
-
-        self.session.exclude_large_files = exclude_large
-        self.session.dry_run = dry_run_enabled
-        self.session.output_dir_name = output_dir or config.OUTPUT_DIR_NAME
-
-        try:
-            self.session.max_file_size_mb = float(max_size_input) if max_size_input else 1.0
-        except ValueError:
-            self.session.max_file_size_mb = 1.0
-
-        # Prepare progress UI
-        progress_container = self.query_one("#progress_container", Vertical)
-        progress_container.remove_children()
+        # The change handlers keep self.session current, so no widget
+        # re-reads are needed here; just commit any Input edits still
+        # sitting behind a debounce timer
+        self._flush_pending_inputs()
 
-        # Add progress bar
-        progress_bar = ProgressBar(total=100, show_percentage=True, show_eta=False)
-        progress_container.mount(progress_bar)
-
-        # Add progress text
-        progress_text = Static("", classes="progress-text")
-        progress_container.mount(progress_text)
+        # Reset the persistent progress widgets in place — no widget
+        # construction, CSS resolution, or mounting per run. The bar counts
+        # whole units, so ticks are integer advances rather than fractions.
+        progress_bar = self._progress_bar
+        progress_bar.update(total=self.session.total_units, progress=0)
+        progress_text = self._progress_text
+        progress_text.update("")
 
         # Update status
-        status = self.query_one("#extraction_status", Static)
+        status = self._status
         status.update("[bold cyan]Starting extraction...[/bold cyan]")
 
-        # Run extraction
+        # Disable the Run button before the worker starts (on the UI thread,
+        # so a double-click can never schedule two workers)
+        self._run_btn.disabled = True
+
+        # Run extraction on a worker thread so the event loop keeps painting
         self._execute_extraction(progress_bar, progress_text, status)
 
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Re-enable the Run button once the extraction worker finishes."""
+        if event.worker.name != "_execute_extraction":
+            return
+        if event.state in (WorkerState.SUCCESS, WorkerState.ERROR, WorkerState.CANCELLED):
+            self._run_btn.disabled = False
+
+    @work(exclusive=True, thread=True)
     def _execute_extraction(
         self,
         progress_bar: ProgressBar,
@@ -758,6 +841,10 @@ class CodebaseExtractorApp(App):
         """
         Execute the extraction with progress updates.
 
+        Runs on a worker thread so the event loop stays free to repaint the
+        progress bar while folders are walked; every widget update is
+        marshalled back with call_from_thread.
+
         Args:
             progress_bar: The progress bar widget to update
             progress_text: The progress text widget to update
@@ -765,68 +852,119 @@ class CodebaseExtractorApp(App):
         """
         # Reset progress
         self.session._completed_units = 0
-        run_ref = str(uuid.uuid4())
-        run_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        run_ref = uuid.uuid4().hex
+        run_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
         total_files_extracted = 0
 
-        # Disable the Run button during extraction
-        run_button = self.query_one("#tree_run_button", Button)
-        run_button.disabled = True
-
         def update_progress():
-            """Update the progress bar and text."""
-            progress = self.session.progress_fraction()
-            progress_bar.advance(progress * 100 - progress_bar.progress)
+            """Update the progress bar and text (runs on the UI thread)."""
+            progress_bar.update(progress=self.session.completed_units)
             progress_text.update(
                 f"[cyan]Processing: {self.session.completed_units}/{self.session.total_units} units[/cyan]"
             )
 
-        try:
-            # Process folders
-            for folder_path in sorted(list(self.session.selected_folders)):
+        # Coalesced UI updates: each widget update triggers a diff+render, so
+        # per-unit repaints dominate wall time on repos with many small
+        # folders. Ticks are capped at ~10 fps; only the newest status
+        # message survives a throttled window, and the last unit forces a
+        # flush so the UI always lands on the final state.
+        last_render = 0.0
+        pending_status = None
+
+        def flush_ui(force=False):
+            """Marshals the latest status and a progress tick, rate-limited."""
+            nonlocal last_render, pending_status
+            now = time.monotonic()
+            if not force and now - last_render < 0.1:
+                return
+            last_render = now
+            if pending_status is not None:
+                self.call_from_thread(status.update, pending_status)
+                pending_status = None
+            self.call_from_thread(update_progress)
+
+        # One immutable filter snapshot serves every unit in the run
+        file_filter = self.session.build_filter()
+
+        # Writer thread: markdown output is pushed through a bounded queue
+        # so result handling never stalls on disk-write latency, and the
+        # maxsize caps how much rendered markdown can sit in memory.
+        write_q: queue.Queue = queue.Queue(maxsize=16)
+
+        def writer_loop():
+            """Pops (content, metadata) jobs and writes them until the sentinel."""
+            while True:
+                job = write_q.get()
+                if job is None:
+                    break
+                content, metadata = job
                 try:
-                    folder_md, folder_count, char_count, word_count = file_handler.extract_code_from_folder(
-                        folder_path,
-                        self.session.exclude_large_files,
-                        self.session.excluded_dirs,
-                        self.session.max_file_size_mb,
-                        self.session.excluded_filenames,
-                        self.session.allowed_filenames,
-                        self.session.allowed_extensions,
+                    file_handler.write_to_markdown_file(
+                        content, metadata, self.root_path, self.session.output_dir_name
                     )
-
-                    if folder_count > 0:
-                        metadata = {
-                            "run_ref": run_ref,
-                            "run_timestamp": run_timestamp,
-                            "folder_name": str(folder_path.relative_to(self.root_path)),
-                            "file_count": folder_count,
-                            "char_count": char_count,
-                            "word_count": word_count,
-                        }
-                        if not self.session.dry_run:
-                            file_handler.write_to_markdown_file(
-                                folder_md, metadata, self.root_path, self.session.output_dir_name
-                            )
-                        total_files_extracted += folder_count
-
-                        status.update(
-                            f"[green]✓ Extracted {folder_count} file(s) from: "
-                            f"{folder_path.relative_to(self.root_path)}[/green]"
-                        )
-                    else:
-                        status.update(
-                            f"[yellow]⚠ No extractable files in: {folder_path.relative_to(self.root_path)}[/yellow]"
-                        )
-
                 except Exception as e:
-                    logging.warning(f"Could not extract from {folder_path}: {e}")
-                    status.update(
-                        f"[red]⚠ Error extracting {folder_path.relative_to(self.root_path)}: {e}[/red]"
-                    )
+                    logging.warning(f"Could not write output for {metadata['folder_name']}: {e}")
                 finally:
-                    self.session.completed_units += 1
-                    update_progress()
+                    write_q.task_done()
+
+        writer = threading.Thread(target=writer_loop, daemon=True)
+        writer.start()
+
+        try:
+            # Process folders concurrently: each extraction is I/O-bound
+            # (directory walk + file reads), so overlapping them on a small
+            # thread pool cuts wall time until the disk saturates. Results
+            # are consumed as they complete on this worker thread, which
+            # keeps markdown writes and counters single-threaded — no locks.
+            folders = sorted(self.session.selected_folders, key=lambda p: p.parts)
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 4)
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        file_handler.extract_code_from_folder,
+                        folder_path,
+                        self.session.exclude_large_files,
+                        file_filter.excluded_dirs,
+                        self.session.max_file_size_mb,
+                        file_filter.excluded_filenames,
+                        file_filter.allowed_filenames,
+                        file_filter.allowed_extensions,
+                        dry_run=self.session.dry_run,
+                    ): folder_path
+                    for folder_path in folders
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    folder_path = futures[future]
+                    # One relative_to per folder; every message and the
+                    # metadata dict reuse the same string
+                    rel_str = str(folder_path.relative_to(self.root_path))
+                    try:
+                        folder_md, folder_count, char_count, word_count = future.result()
+
+                        if folder_count > 0:
+                            metadata = {
+                                "run_ref": run_ref,
+                                "run_timestamp": run_timestamp,
+                                "folder_name": rel_str,
+                                "file_count": folder_count,
+                                "char_count": char_count,
+                                "word_count": word_count,
+                            }
+                            if not self.session.dry_run:
+                                write_q.put((folder_md, metadata))
+                            total_files_extracted += folder_count
+
+                            pending_status = _MSG_FOLDER_OK.format(n=folder_count, p=rel_str)
+                        else:
+                            pending_status = _MSG_FOLDER_EMPTY.format(p=rel_str)
+
+                    except Exception as e:
+                        logging.warning(f"Could not extract from {folder_path}: {e}")
+                        pending_status = _MSG_FOLDER_ERR.format(p=rel_str, e=e)
+                    finally:
+                        self.session.completed_units += 1
+                        flush_ui(force=self.session.completed_units == self.session.total_units)
 
             # Process root files if selected
             if self.session.include_root_files:
@@ -836,9 +974,10 @@ class CodebaseExtractorApp(App):
                         self.root_path,
                         self.session.exclude_large_files,
                         self.session.max_file_size_mb,
-                        self.session.excluded_filenames,
-                        self.session.allowed_filenames,
-                        self.session.allowed_extensions,
+                        file_filter.excluded_filenames,
+                        file_filter.allowed_filenames,
+                        file_filter.allowed_extensions,
+                        dry_run=self.session.dry_run,
                     )
 
                     if root_count > 0:
@@ -851,48 +990,59 @@ class CodebaseExtractorApp(App):
                             "word_count": word_count,
                         }
                         if not self.session.dry_run:
-                            file_handler.write_to_markdown_file(
-                                root_md, metadata, self.root_path, self.session.output_dir_name
-                            )
+                            write_q.put((root_md, metadata))
                         total_files_extracted += root_count
 
-                        status.update(
-                            f"[green]✓ Extracted {root_count} file(s) from root directory[/green]"
-                        )
+                        pending_status = _MSG_ROOT_OK.format(n=root_count)
                     else:
-                        status.update("[yellow]⚠ No extractable files in root directory[/yellow]")
+                        pending_status = _MSG_ROOT_EMPTY
 
                 except Exception as e:
                     logging.warning(f"Could not extract from root: {e}")
-                    status.update(f"[red]⚠ Error extracting root files: {e}[/red]")
+                    pending_status = _MSG_ROOT_ERR.format(e=e)
                 finally:
                     self.session.completed_units += 1
-                    update_progress()
+                    flush_ui(force=True)
+
+            # Drain pending writes so the summary never precedes the files
+            write_q.join()
 
             # Final summary
             dry_run_suffix = " (dry-run preview)" if self.session.dry_run else ""
             if total_files_extracted > 0:
-                status.update(
-                    f"[bold green]✓ Extraction complete!{dry_run_suffix} "
-                    f"Extracted {total_files_extracted} file(s) total.[/bold green]"
+                self.call_from_thread(
+                    status.update, _MSG_DONE.format(sfx=dry_run_suffix, n=total_files_extracted)
                 )
-                progress_text.update(
-                    f"[green]Complete: {self.session.completed_units}/{self.session.total_units} units[/green]"
+                self.call_from_thread(
+                    progress_text.update,
+                    f"[green]Complete: {self.session.completed_units}/{self.session.total_units} units[/green]",
                 )
             else:
-                status.update(
-                    f"[bold yellow]⚠ Extraction complete but no files matched criteria.{dry_run_suffix}[/bold yellow]"
-                )
+                self.call_from_thread(status.update, _MSG_DONE_EMPTY.format(sfx=dry_run_suffix))
 
         except KeyboardInterrupt:
             # Handle cancellation
-            status.update("[bold red]Extraction cancelled by user.[/bold red]")
+            self.call_from_thread(status.update, "[bold red]Extraction cancelled by user.[/bold red]")
         finally:
-            # Re-enable the Run button
-            run_button.disabled = False
+            # Stop the writer thread whether the run finished or bailed out
+            write_q.put(None)
+            writer.join()
 
 
 def launch_tui() -> None:
     """Launch the Textual TUI application."""
-    app = CodebaseExtractorApp()
-    app.run()
+    # Swap the root logger's handlers for a queue while the TUI runs: the
+    # logging.warning calls on the extraction threads become O(1) enqueues
+    # and a QueueListener drains to the real handlers off the hot path.
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    log_queue = queue.SimpleQueue()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        app = CodebaseExtractorApp()
+        app.run()
+    finally:
+        listener.stop()
+        root_logger.handlers = handlers